@@ -77,16 +77,20 @@ def build_prompt(chapters: Dict[str, List[str]], story_text: str = "") -> str:
         "Analyze carefully and report all role completeness violations.\n\n"
     )
 
+    # Collect the sections and join once; the story text can be several MB,
+    # so repeated += would copy it for every chapter appended after it.
+    parts = [prompt]
+
     # Include the full story text
     if story_text:
-        prompt += "=== FULL RAW STORY TEXT ===\n"
-        prompt += story_text + "\n\n"
+        parts.append("=== FULL RAW STORY TEXT ===\n")
+        parts.append(story_text + "\n\n")
     
-    prompt += "=== EXTRACTED ROLE EVENTS BY CHAPTER ===\n\n"
+    parts.append("=== EXTRACTED ROLE EVENTS BY CHAPTER ===\n\n")
     for chap_id, events in chapters.items():
-        prompt += f"Chapter {chap_id}:\n" + "\n".join(events) + "\n\n"
+        parts.append(f"Chapter {chap_id}:\n" + "\n".join(events) + "\n\n")
     
-    return prompt
+    return "".join(parts)
 
 def call_reasoning_llm(prompt: str) -> str:
     headers = {
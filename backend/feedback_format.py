@@ -0,0 +1,26 @@
+"""
+Rendering of LLM feedback text for the frontend
+"""
+
+import re
+
+# **bold** spans first, then "quoted" spans; both are rendered bold. Running
+# the quote pass over the bold pass's output means a quote that overlaps a
+# bold span still gets its own <b>. The quote pattern uses a negated class
+# so it never backtracks.
+_BOLD_RE = re.compile(r"\*\*(.*?)\*\*")
+_QUOTE_RE = re.compile(r'"([^"\n]*)"')
+
+
+def format_feedback_html(feedback_text: str) -> str:
+    """
+    Convert LLM feedback text into the HTML snippet shown by the frontend.
+
+    Args:
+        feedback_text: Raw feedback returned by a rule's generator
+
+    Returns:
+        HTML with bold/quoted spans in <b> and newlines as <br>
+    """
+    html_text = _QUOTE_RE.sub(r"<b>\1</b>", _BOLD_RE.sub(r"<b>\1</b>", feedback_text))
+    return html_text.replace("\n", "<br>")
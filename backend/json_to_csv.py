@@ -65,9 +65,10 @@ def run_json_to_csv(
             "text"
         ]
 
+        # Rows are written as tuples in fieldnames order (no per-row dict)
         with open(csv_path, "w", newline="", encoding="utf-8") as csvfile:
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            writer.writeheader()
+            writer = csv.writer(csvfile)
+            writer.writerow(fieldnames)
 
             for ev in events:
                 time_type = ev.get("time_type")
@@ -76,16 +77,16 @@ def run_json_to_csv(
                 if time_type is None:
                     continue
 
-                writer.writerow({
-                    "event_id": ev.get("event_id"),
-                    "chapter_id": ev.get("chapter_id"),
-                    "sentence_id": ev.get("sentence_id"),
-                    "action_lemma": ev.get("action_lemma"),
-                    "time_raw": ev.get("time_raw"),
-                    "time_normalized": ev.get("time_normalized"),
-                    "time_type": time_type,
-                    "text": ev.get("text"),
-                })
+                writer.writerow((
+                    ev.get("event_id"),
+                    ev.get("chapter_id"),
+                    ev.get("sentence_id"),
+                    ev.get("action_lemma"),
+                    ev.get("time_raw"),
+                    ev.get("time_normalized"),
+                    time_type,
+                    ev.get("text"),
+                ))
 
         log("You selected Temporal Consistencies", log_callback)
         return csv_path
@@ -107,9 +108,10 @@ def run_json_to_csv(
             "text",
         ]
 
+        # Rows are written as tuples in fieldnames order (no per-row dict)
         with open(csv_path, "w", newline="", encoding="utf-8") as csvfile:
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            writer.writeheader()
+            writer = csv.writer(csvfile)
+            writer.writerow(fieldnames)
 
             for ev in events:
                 actor = ev.get("actor")
@@ -118,16 +120,16 @@ def run_json_to_csv(
                 if actor is None:
                     continue
 
-                writer.writerow({
-                    "event_id": ev.get("event_id"),
-                    "chapter_id": ev.get("chapter_id"),
-                    "sentence_id": ev.get("sentence_id"),
-                    "action_lemma": ev.get("action_lemma"),
-                    "actor": actor,
-                    "target": ev.get("target") or "",
-                    "location": ev.get("location") or "",
-                    "text": ev.get("text"),
-                })
+                writer.writerow((
+                    ev.get("event_id"),
+                    ev.get("chapter_id"),
+                    ev.get("sentence_id"),
+                    ev.get("action_lemma"),
+                    actor,
+                    ev.get("target") or "",
+                    ev.get("location") or "",
+                    ev.get("text"),
+                ))
 
         log("You selected Role Completeness", log_callback)
         return csv_path
@@ -4,7 +4,7 @@ import os
 import sys
 import traceback
 from datetime import datetime
-from typing import Optional
+from typing import Callable, Optional
 from pathlib import Path
 import sys
 from pathlib import Path
@@ -25,7 +25,7 @@ if __name__ == "__main__" and __package__ is None:
     from backend.step3_temporal_normalization import normalize_temporal_expressions
     from backend.step4_semantic_representation import create_semantic_representations
     from backend.step5_memory_storage import create_memory_module
-    from backend.utils import ensure_directory, get_reference_date
+    from backend.utils import ensure_directory, get_reference_date, clear_directory_cache
 else:
     # Running as module - use relative imports
     from .step1_text_processing import process_text
@@ -33,7 +33,21 @@ else:
     from .step3_temporal_normalization import normalize_temporal_expressions
     from .step4_semantic_representation import create_semantic_representations
     from .step5_memory_storage import create_memory_module
-    from .utils import ensure_directory, get_reference_date
+    from .utils import ensure_directory, get_reference_date, clear_directory_cache
+
+
+def log(msg: str, callback: Optional[Callable[[str], None]] = None) -> None:
+    if callback:
+        callback(msg)
+    else:
+        print(msg)
+
+
+def log_traceback(callback: Optional[Callable[[str], None]] = None) -> None:
+    if callback:
+        callback(traceback.format_exc().rstrip())
+    else:
+        traceback.print_exc()
 
 
 def validate_input(input_file: str) -> bool:
@@ -79,12 +93,16 @@ def clear_output_directory(output_dir: str | Path) -> None:
     if output_dir.exists() and output_dir.is_dir():
         #print(f"Deleting output directory: {output_dir}")
         shutil.rmtree(output_dir)
+    # Even when there was nothing to delete: the tree may have been removed
+    # elsewhere (e.g. by /reset) while its entries were still cached
+    clear_directory_cache()
 
 def run_pipeline(
     input_file: str,
     output_dir: str = "../output",
     reference_date: Optional[str] = None,
-    embedding_model: str = "all-MiniLM-L6-v2"
+    embedding_model: str = "all-MiniLM-L6-v2",
+    log_callback: Optional[Callable[[str], None]] = None
 ) -> str:
     output_path = PROJECT_ROOT / output_dir
 
@@ -98,6 +116,7 @@ def run_pipeline(
         output_dir: Output directory for all processed files
         reference_date: Reference date for temporal normalization (defaults to current date)
         embedding_model: Sentence transformer model name
+        log_callback: Optional callable receiving progress lines; defaults to print
         
     Returns:
         Path to the final memory_module.json file
@@ -113,7 +132,7 @@ def run_pipeline(
     
     # Validate input
     #print("Step 0: Validating input...")
-    print("Validating input...")
+    log("Validating input...", log_callback)
     if not validate_input(input_file):
         raise FileNotFoundError(f"Invalid input file: {input_file}")
     #print(f"OK: Input file validated: {input_file}")
@@ -121,7 +140,7 @@ def run_pipeline(
     
     # Setup output directories
     #print("Step 0: Setting up output directories...")
-    print("Setting up output directories...")
+    log("Setting up output directories...", log_callback)
     setup_output_directories(output_path)
     #print(f"OK: Output directories created: {output_dir}")
     #print()
@@ -135,116 +154,116 @@ def run_pipeline(
     try:
         # Step 1: Text Processing
         #print("=" * 60)
-        print()
-        print("STEP 1: Text Processing")
+        log("", log_callback)
+        log("STEP 1: Text Processing", log_callback)
         #print("=" * 60)
         #print(f"[{datetime.now().strftime('%H:%M:%S')}] Starting Step 1...")
         try:
             text_data = process_text(input_file, output_dir)
-            print()
-            print(f"[{datetime.now().strftime('%H:%M:%S')}] OK: Step 1 completed successfully")
-            print(f"  - Processed {len(text_data.get('chapters', []))} chapters")
-            print(f"  - Processed {len(text_data.get('sentences', []))} sentences")
+            log("", log_callback)
+            log(f"[{datetime.now().strftime('%H:%M:%S')}] OK: Step 1 completed successfully", log_callback)
+            log(f"  - Processed {len(text_data.get('chapters', []))} chapters", log_callback)
+            log(f"  - Processed {len(text_data.get('sentences', []))} sentences", log_callback)
         except Exception as e:
             error_msg = f"Step 1 (Text Processing) failed: {str(e)}"
-            print(f"[{datetime.now().strftime('%H:%M:%S')}] ERROR: {error_msg}")
-            print("\nError details:")
-            traceback.print_exc()
+            log(f"[{datetime.now().strftime('%H:%M:%S')}] ERROR: {error_msg}", log_callback)
+            log("\nError details:", log_callback)
+            log_traceback(log_callback)
             step_errors.append(error_msg)
             raise
-        print()
+        log("", log_callback)
         
         # Step 2: Event & Role Extraction
         #print("=" * 60)
-        print("STEP 2: Event & Role Extraction")
+        log("STEP 2: Event & Role Extraction", log_callback)
         #print("=" * 60)
         #print(f"[{datetime.now().strftime('%H:%M:%S')}] Starting Step 2...")
         try:
             events = extract_events(output_dir, output_dir)
-            print()
-            print(f"[{datetime.now().strftime('%H:%M:%S')}] OK: Step 2 completed successfully")
-            print(f"  - Extracted {len(events)} events")
+            log("", log_callback)
+            log(f"[{datetime.now().strftime('%H:%M:%S')}] OK: Step 2 completed successfully", log_callback)
+            log(f"  - Extracted {len(events)} events", log_callback)
         except Exception as e:
             error_msg = f"Step 2 (Event Extraction) failed: {str(e)}"
-            print(f"[{datetime.now().strftime('%H:%M:%S')}] ERROR: {error_msg}")
-            print("\nError details:")
-            traceback.print_exc()
+            log(f"[{datetime.now().strftime('%H:%M:%S')}] ERROR: {error_msg}", log_callback)
+            log("\nError details:", log_callback)
+            log_traceback(log_callback)
             step_errors.append(error_msg)
             raise
-        print()
+        log("", log_callback)
         
         # Step 3: Temporal Normalization
         #print("=" * 60)
-        print("STEP 3: Temporal Normalization")
+        log("STEP 3: Temporal Normalization", log_callback)
         #print("=" * 60)
         #print(f"[{datetime.now().strftime('%H:%M:%S')}] Starting Step 3...")
         #print(f"  - Using reference date: {reference_date}")
         try:
             timestamps = normalize_temporal_expressions(output_dir, output_dir, reference_date)
-            print()
-            print(f"[{datetime.now().strftime('%H:%M:%S')}] OK: Step 3 completed successfully")
+            log("", log_callback)
+            log(f"[{datetime.now().strftime('%H:%M:%S')}] OK: Step 3 completed successfully", log_callback)
             total_expr = timestamps.get("total_expressions", 0)
-            print(f"  - Normalized {total_expr} time expressions")
+            log(f"  - Normalized {total_expr} time expressions", log_callback)
         except Exception as e:
             error_msg = f"Step 3 (Temporal Normalization) failed: {str(e)}"
-            print(f"[{datetime.now().strftime('%H:%M:%S')}] ERROR: {error_msg}")
-            print("\nError details:")
-            traceback.print_exc()
+            log(f"[{datetime.now().strftime('%H:%M:%S')}] ERROR: {error_msg}", log_callback)
+            log("\nError details:", log_callback)
+            log_traceback(log_callback)
             step_errors.append(error_msg)
             raise
-        print()
+        log("", log_callback)
         
         # Step 4: Semantic Representation
         #print("=" * 60)
-        print("STEP 4: Semantic Representation & Memory Structuring")
+        log("STEP 4: Semantic Representation & Memory Structuring", log_callback)
         #print("=" * 60)
         #print(f"[{datetime.now().strftime('%H:%M:%S')}] Starting Step 4...")
         #print(f"  - Using embedding model: {embedding_model}")
         try:
             semantic_data = create_semantic_representations(output_dir, output_dir, embedding_model)
-            print(f"\n[{datetime.now().strftime('%H:%M:%S')}] OK: Step 4 completed successfully")
+            log(f"\n[{datetime.now().strftime('%H:%M:%S')}] OK: Step 4 completed successfully", log_callback)
             total_events = semantic_data.get("semantic_memory", {}).get("total_events", 0)
             emb_dim = semantic_data.get("semantic_memory", {}).get("embedding_dim", 0)
             #print(f"  - Generated embeddings for {total_events} events")
             #print(f"  - Embedding dimension: {emb_dim}")
         except Exception as e:
             error_msg = f"Step 4 (Semantic Representation) failed: {str(e)}"
-            print(f"[{datetime.now().strftime('%H:%M:%S')}] ERROR: {error_msg}")
-            print("\nError details:")
-            traceback.print_exc()
+            log(f"[{datetime.now().strftime('%H:%M:%S')}] ERROR: {error_msg}", log_callback)
+            log("\nError details:", log_callback)
+            log_traceback(log_callback)
             step_errors.append(error_msg)
             raise
-        print()
+        log("", log_callback)
         
         # Step 5: Memory Storage
         #print("=" * 60)
-        print("STEP 5: Temporal Memory Storage Layer")
+        log("STEP 5: Temporal Memory Storage Layer", log_callback)
         #print("=" * 60)
         #print(f"[{datetime.now().strftime('%H:%M:%S')}] Starting Step 5...")
         try:
             memory_module = create_memory_module(output_dir, output_dir)
-            print()
-            print(f"[{datetime.now().strftime('%H:%M:%S')}] OK: Step 5 completed successfully")
+            log("", log_callback)
+            log(f"[{datetime.now().strftime('%H:%M:%S')}] OK: Step 5 completed successfully", log_callback)
             metadata = memory_module.get("metadata", {})
-            print(f"  - Total chapters: {metadata.get('total_chapters', 0)}")
-            print(f"  - Total sentences: {metadata.get('total_sentences', 0)}")
-            print(f"  - Total events: {metadata.get('total_events', 0)}")
-            print(f"  - Total characters: {metadata.get('total_characters', 0)}")
+            log(f"  - Total chapters: {metadata.get('total_chapters', 0)}", log_callback)
+            log(f"  - Total sentences: {metadata.get('total_sentences', 0)}", log_callback)
+            log(f"  - Total events: {metadata.get('total_events', 0)}", log_callback)
+            log(f"  - Total characters: {metadata.get('total_characters', 0)}", log_callback)
         except Exception as e:
             error_msg = f"Step 5 (Memory Storage) failed: {str(e)}"
-            print(f"[{datetime.now().strftime('%H:%M:%S')}] ERROR: {error_msg}")
-            print("\nError details:")
-            traceback.print_exc()
+            log(f"[{datetime.now().strftime('%H:%M:%S')}] ERROR: {error_msg}", log_callback)
+            log("\nError details:", log_callback)
+            log_traceback(log_callback)
             step_errors.append(error_msg)
             raise
         
-        print()
+        log("", log_callback)
         
         # Final output path
         final_output_path = os.path.join(output_dir, "memory", "memory_module.json")
         
         #print("=" * 60)
-        print("Temporal Memory Pipeline Completed Successfully!")
+        log("Temporal Memory Pipeline Completed Successfully!", log_callback)
         #print("=" * 60)
         # print(f"[{datetime.now().strftime('%H:%M:%S')}] Final memory module: {final_output_path}")
         # print()
@@ -263,23 +282,23 @@ def run_pipeline(
         return final_output_path
         
     except Exception as e:
-        print()
-        print("=" * 60)
-        print("Temporal Memory Pipeline Failed!")
-        print("=" * 60)
-        print(f"[{datetime.now().strftime('%H:%M:%S')}] Error occurred during pipeline execution")
-        print()
+        log("", log_callback)
+        log("=" * 60, log_callback)
+        log("Temporal Memory Pipeline Failed!", log_callback)
+        log("=" * 60, log_callback)
+        log(f"[{datetime.now().strftime('%H:%M:%S')}] Error occurred during pipeline execution", log_callback)
+        log("", log_callback)
         if step_errors:
-            print("Failed steps:")
+            log("Failed steps:", log_callback)
             for i, error in enumerate(step_errors, 1):
-                print(f"  {i}. {error}")
-            print()
-        print(f"Error type: {type(e).__name__}")
-        print(f"Error message: {str(e)}")
-        print()
-        print("Full traceback:")
-        traceback.print_exc()
-        print()
+                log(f"  {i}. {error}", log_callback)
+            log("", log_callback)
+        log(f"Error type: {type(e).__name__}", log_callback)
+        log(f"Error message: {str(e)}", log_callback)
+        log("", log_callback)
+        log("Full traceback:", log_callback)
+        log_traceback(log_callback)
+        log("", log_callback)
         raise RuntimeError(f"Pipeline execution failed at step: {step_errors[-1] if step_errors else 'Unknown'}") from e
 
 
@@ -3,12 +3,25 @@ Step 5: Temporal Memory Storage Layer
 Constructs the final, unified memory module combining all processed data.
 """
 
-from typing import List, Dict, Any, Set
+from collections import defaultdict
+from typing import List, Dict, Any, Optional, Set
 from pathlib import Path
 from datetime import datetime
 from .utils import load_json, save_json, ensure_directory
 
 
+# spaCy entity label -> extract_characters_entities bucket (anything else is "other_entities")
+ENTITY_LABEL_BUCKETS = {
+    "PERSON": "characters",
+    "GPE": "locations",
+    "LOC": "locations",
+    "ORG": "organizations",
+    "DATE": "dates",
+    "TIME": "times",
+}
+ENTITY_BUCKET_KEYS = ("characters", "locations", "organizations", "dates", "times", "other_entities")
+
+
 def extract_characters_entities(events: List[Dict], sentences: List[Dict]) -> Dict[str, Any]:
     """
     Extract unique characters and entities from events and sentences.
@@ -20,76 +33,51 @@ def extract_characters_entities(events: List[Dict], sentences: List[Dict]) -> Di
     Returns:
         Dictionary containing characters and entities
     """
-    characters: Set[str] = set()
-    locations: Set[str] = set()
-    organizations: Set[str] = set()
-    dates: Set[str] = set()
-    times: Set[str] = set()
-    other_entities: Set[str] = set()
+    buckets: Dict[str, Set[str]] = {key: set() for key in ENTITY_BUCKET_KEYS}
+    
+    def add_structured(entity: Dict) -> None:
+        entity_text = entity.get("text", "").strip()
+        entity_label = entity.get("label", "").upper()
+        buckets[ENTITY_LABEL_BUCKETS.get(entity_label, "other_entities")].add(entity_text)
     
     # Extract from events
     for event in events:
         # Extract actor (likely a character)
         actor = event.get("actor")
         if actor:
-            characters.add(actor.strip())
+            buckets["characters"].add(actor.strip())
         
         # Extract entities from event
-        entities = event.get("entities", [])
-        for entity in entities:
+        for entity in event.get("entities", []):
             if isinstance(entity, str):
                 # Simple string entity
-                other_entities.add(entity.strip())
+                buckets["other_entities"].add(entity.strip())
             elif isinstance(entity, dict):
                 # Structured entity with label
-                entity_text = entity.get("text", "").strip()
-                entity_label = entity.get("label", "").upper()
-                
-                if entity_label == "PERSON":
-                    characters.add(entity_text)
-                elif entity_label in ["GPE", "LOC"]:
-                    locations.add(entity_text)
-                elif entity_label == "ORG":
-                    organizations.add(entity_text)
-                elif entity_label == "DATE":
-                    dates.add(entity_text)
-                elif entity_label == "TIME":
-                    times.add(entity_text)
-                else:
-                    other_entities.add(entity_text)
+                add_structured(entity)
     
     # Extract from sentences
     for sentence in sentences:
-        entities = sentence.get("entities", [])
-        for entity in entities:
+        for entity in sentence.get("entities", []):
             if isinstance(entity, dict):
-                entity_text = entity.get("text", "").strip()
-                entity_label = entity.get("label", "").upper()
-                
-                if entity_label == "PERSON":
-                    characters.add(entity_text)
-                elif entity_label in ["GPE", "LOC"]:
-                    locations.add(entity_text)
-                elif entity_label == "ORG":
-                    organizations.add(entity_text)
-                elif entity_label == "DATE":
-                    dates.add(entity_text)
-                elif entity_label == "TIME":
-                    times.add(entity_text)
-                else:
-                    other_entities.add(entity_text)
+                add_structured(entity)
     
-    return {
-        "characters": sorted(list(characters)),
-        "locations": sorted(list(locations)),
-        "organizations": sorted(list(organizations)),
-        "dates": sorted(list(dates)),
-        "times": sorted(list(times)),
-        "other_entities": sorted(list(other_entities)),
-        "total_characters": len(characters),
-        "total_locations": len(locations),
-        "total_organizations": len(organizations)
-    }
+    result: Dict[str, Any] = {key: sorted(values) for key, values in buckets.items()}
+    result["total_characters"] = len(buckets["characters"])
+    result["total_locations"] = len(buckets["locations"])
+    result["total_organizations"] = len(buckets["organizations"])
+    return result
+
+
+def _timeline_sort_key(entry: tuple) -> tuple:
+    """
+    Sort key for (event_id, parsed_time, normalized_time) timeline entries.
+    
+    datetime.min stands in for a missing parsed time so every key compares
+    datetime to datetime; entries without a parsed time still sort first.
+    """
+    _, parsed_time, normalized_time = entry
+    return (parsed_time is not None, parsed_time or datetime.min, normalized_time or "")
 
 
 def build_timeline(events: List[Dict]) -> List[str]:
@@ -130,26 +118,34 @@ def build_timeline(events: List[Dict]) -> List[str]:
             event_times.append((event_id, None, None))
     
     # Sort by parsed time, then by string
-    event_times.sort(key=lambda x: (x[1] is not None, x[1] if x[1] is not None else "", x[2] or ""))
+    event_times.sort(key=_timeline_sort_key)
     
     return [event_id for event_id, _, _ in event_times]
 
 
-def build_temporal_edges(events: List[Dict]) -> List[Dict[str, Any]]:
+def build_temporal_edges(
+    events: List[Dict],
+    event_map: Optional[Dict[str, Dict]] = None,
+    timeline: Optional[List[str]] = None
+) -> List[Dict[str, Any]]:
     """
     Build temporal edges (before/after relations) between events.
     
     Args:
         events: List of event dictionaries
+        event_map: Optional event_id -> event lookup (built if not provided)
+        timeline: Optional pre-built timeline from build_timeline (built if not provided)
         
     Returns:
         List of temporal edge dictionaries
     """
     temporal_edges = []
-    event_map = {event.get("event_id"): event for event in events}
+    if event_map is None:
+        event_map = {event.get("event_id"): event for event in events}
     
     # Build timeline to get ordering
-    timeline = build_timeline(events)
+    if timeline is None:
+        timeline = build_timeline(events)
     
     # Create edges based on timeline ordering
     for i in range(len(timeline) - 1):
@@ -283,24 +279,25 @@ def build_canonical_entity_graph(events: List[Dict], sentences: List[Dict]) -> D
         Canonical entity graph structure
     """
     # Extract all entities with their types
-    entity_map = {}  # entity_text -> {label, occurrences: [event_ids]}
+    # entity_text -> {label, occurrences: [event_ids]}
+    entity_map = defaultdict(lambda: {"label": "", "occurrences": []})
     
     for event in events:
         event_id = event.get("event_id")
-        entities = event.get("entities", [])
         
-        for entity in entities:
-            if isinstance(entity, dict):
-                entity_text = entity.get("text", "")
-                entity_label = entity.get("label", "")
-                
-                if entity_text:
-                    if entity_text not in entity_map:
-                        entity_map[entity_text] = {
-                            "label": entity_label,
-                            "occurrences": []
-                        }
-                    entity_map[entity_text]["occurrences"].append(event_id)
+        for entity in event.get("entities", ()):
+            if not isinstance(entity, dict):
+                continue
+            entity_text = entity.get("text")
+            if not entity_text:
+                continue
+            
+            record = entity_map[entity_text]
+            if not record["label"]:
+                record["label"] = entity.get("label", "")
+            record["occurrences"].append(event_id)
+    
+    entity_map = dict(entity_map)
     
     # Group by label
     entities_by_label = {}
@@ -328,7 +325,8 @@ def build_memory_module(
     timestamps: Dict[str, Any],
     embeddings: Dict[str, Any],
     entities: Dict[str, Any],
-    semantic_memory: List[Dict]
+    semantic_memory: List[Dict],
+    fields: Optional[Set[str]] = None
 ) -> Dict[str, Any]:
     """
     Combine all data into unified memory module.
@@ -341,33 +339,64 @@ def build_memory_module(
         embeddings: Dictionary containing embedding data
         entities: Dictionary containing extracted entities
         semantic_memory: List of semantic memory entries
+        fields: Optional set of memory module keys to build (e.g. {"events", "entities"}).
+            Builders for keys not in the set are skipped and their keys left empty.
+            Defaults to building everything.
         
     Returns:
         Unified memory module dictionary
     """
+    def wanted(*names: str) -> bool:
+        return fields is None or any(name in fields for name in names)
+    
+    # Shared event lookup for the builders below
+    event_map = {event.get("event_id"): event for event in events}
+    
+    timeline = []
+    temporal_edges = []
+    semantic_edges = []
+    event_graph = {}
+    chapter_map = {}
+    canonical_entities = {}
+    
     # Build timeline
-    print("Building timeline...")
-    timeline = build_timeline(events)
+    if wanted("timeline", "temporal_edges", "event_graph"):
+        print("Building timeline...")
+        timeline = build_timeline(events)
     
     # Build temporal edges
-    print("Building temporal edges...")
-    temporal_edges = build_temporal_edges(events)
+    if wanted("temporal_edges", "event_graph"):
+        print("Building temporal edges...")
+        temporal_edges = build_temporal_edges(events, event_map=event_map, timeline=timeline)
     
     # Build semantic edges
-    print("Building semantic edges...")
-    semantic_edges = build_semantic_edges(semantic_memory, similarity_threshold=0.7)
+    if wanted("semantic_edges", "event_graph"):
+        print("Building semantic edges...")
+        semantic_edges = build_semantic_edges(semantic_memory, similarity_threshold=0.7)
     
     # Build event graph
-    print("Building event graph...")
-    event_graph = build_event_graph(temporal_edges, semantic_edges)
+    if wanted("event_graph"):
+        print("Building event graph...")
+        event_graph = build_event_graph(temporal_edges, semantic_edges)
     
     # Build chapter map
-    print("Building chapter map...")
-    chapter_map = build_chapter_map(events)
+    if wanted("chapter_map"):
+        print("Building chapter map...")
+        chapter_map = build_chapter_map(events)
     
     # Build canonical entity graph
-    print("Building canonical entity graph...")
-    canonical_entities = build_canonical_entity_graph(events, sentences)
+    if wanted("entities"):
+        print("Building canonical entity graph...")
+        canonical_entities = build_canonical_entity_graph(events, sentences)
+    
+    if not wanted("timeline"):
+        timeline = []
+    if not wanted("temporal_edges"):
+        temporal_edges = []
+    if not wanted("semantic_edges"):
+        semantic_edges = []
+    if not wanted("semantic_memory"):
+        semantic_memory = []
     
     memory_module = {
         "events": events,  # Full event frames
@@ -410,13 +439,19 @@ def save_memory_module(memory_module: Dict[str, Any], output_path: str) -> None:
     print(f"Saved unified memory module to {output_path}")
 
 
-def create_memory_module(input_dir: str, output_dir: str = "output") -> Dict[str, Any]:
+def create_memory_module(
+    input_dir: str,
+    output_dir: str = "output",
+    fields: Optional[Set[str]] = None
+) -> Dict[str, Any]:
     """
     Main function to create the unified memory module.
     
     Args:
         input_dir: Directory containing all processed files
         output_dir: Output directory for memory module
+        fields: Optional set of memory module keys to build (see build_memory_module).
+            Defaults to building everything.
         
     Returns:
         Unified memory module dictionary
@@ -457,9 +492,11 @@ def create_memory_module(input_dir: str, output_dir: str = "output") -> Dict[str
     
     embeddings_data = load_json(f"{input_dir}/memory/event_embeddings.json")
     
-    # Load semantic memory
-    semantic_memory_data = load_json(f"{input_dir}/memory/memory_semantic.json")
-    semantic_memory = semantic_memory_data.get("semantic_memory", [])
+    # Load semantic memory (embeddings included, so skip it when nothing uses it)
+    semantic_memory = []
+    if fields is None or fields & {"semantic_memory", "semantic_edges", "event_graph"}:
+        semantic_memory_data = load_json(f"{input_dir}/memory/memory_semantic.json")
+        semantic_memory = semantic_memory_data.get("semantic_memory", [])
     
     # Extract characters and entities
     print("Extracting characters and entities...")
@@ -474,7 +511,8 @@ def create_memory_module(input_dir: str, output_dir: str = "output") -> Dict[str
         timestamps=timestamps_data,
         embeddings=embeddings_data,
         entities=entities,
-        semantic_memory=semantic_memory
+        semantic_memory=semantic_memory,
+        fields=fields
     )
     
     # Save memory module
@@ -3,12 +3,31 @@ Utility functions for the Temporal Memory Layer
 """
 
 import json
+import math
+import mmap
 import os
-from datetime import datetime
-from pathlib import Path
-from typing import Dict, Any, List, Union
+import re
+import threading
+from datetime import date
+from typing import Dict, Any, Iterable, List, Set, Union
 from backend.pdf_parser import extract_pdf_text, PDFParseError
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib json module
+    orjson = None
+
+# .txt inputs larger than this are decoded from a memory map
+MMAP_THRESHOLD_BYTES = 1024 * 1024
+
+# orjson reads integers beyond 64 bits as floats, losing digits; any run of
+# 19+ digits (which may be such an integer) sends the file to the stdlib parser
+_WIDE_INT_RE = re.compile(rb"\d{19,}")
+
+_ORJSON_SAVE_OPTIONS = (
+    orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+    if orjson is not None else 0
+)
 
 
 def load_json(filepath: str) -> Dict[str, Any]:
@@ -25,14 +44,43 @@ def load_json(filepath: str) -> Dict[str, Any]:
         FileNotFoundError: If file doesn't exist
         json.JSONDecodeError: If file is not valid JSON
     """
-    with open(filepath, 'r', encoding='utf-8') as f:
-        return json.load(f)
+    # Unbuffered raw read: the file is consumed in one readall(), so the
+    # BufferedReader layer would only add an extra copy
+    with open(filepath, 'rb', buffering=0) as f:
+        raw = f.read()
+    if orjson is not None and not _WIDE_INT_RE.search(raw):
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            # stdlib json also accepts NaN/Infinity, which older files may contain
+            pass
+    return json.loads(raw)
+
+
+def _has_non_finite_float(data: Any) -> bool:
+    """Whether a JSON-like structure holds a NaN or infinite float anywhere."""
+    stack = [data]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, float):
+            if not math.isfinite(value):
+                return True
+        elif isinstance(value, dict):
+            stack.extend(value.values())
+        elif isinstance(value, (list, tuple)):
+            stack.extend(value)
+    return False
 
 
 def save_json(data: Union[Dict[str, Any], List[Any]], filepath: str) -> None:
     """
     Save dictionary or list to JSON file.
     
+    When orjson is installed, floats are written in its shortest round-trip
+    form (1e-05 becomes 0.00001, 1e+16 becomes 1e16); they load back as the
+    same values. Data holding NaN or Infinity goes through the stdlib encoder
+    instead, which keeps them as NaN/Infinity where orjson would write null.
+    
     Args:
         data: Dictionary or list to save
         filepath: Path where to save JSON file
@@ -40,19 +88,115 @@ def save_json(data: Union[Dict[str, Any], List[Any]], filepath: str) -> None:
     dir_path = os.path.dirname(filepath)
     if dir_path:
         ensure_directory(dir_path)
-    with open(filepath, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    # Serialize up front and write once; json.dump issues a write per token
+    payload = None
+    if orjson is not None:
+        try:
+            payload = orjson.dumps(data, option=_ORJSON_SAVE_OPTIONS)
+        except TypeError:
+            # e.g. integers wider than 64 bits; let the stdlib encoder handle it
+            payload = None
+        # Non-finite floats come out as null, so only a payload containing
+        # null needs the (slower) scan for them
+        if payload is not None and b"null" in payload and _has_non_finite_float(data):
+            payload = None
+    if payload is None:
+        payload = json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+    # Write to a sibling temp file and swap it in, so readers never see a
+    # truncated file. Unbuffered: the payload goes out in one write() syscall
+    # instead of being split between a direct write and a buffered tail.
+    # The temp name is per process and thread, so concurrent writers of the
+    # same file never share (and publish) each other's partial temp file
+    tmp_path = f"{filepath}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with _open_in_directory(tmp_path, 'wb', dir_path, buffering=0) as f:
+            view = memoryview(payload)
+            while view:
+                # Raw writes may be short (e.g. past the kernel's ~2 GiB limit)
+                view = view[f.write(view):]
+        os.replace(tmp_path, filepath)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def append_jsonl(records: Iterable[Dict[str, Any]], filepath: str) -> None:
+    """
+    Append records to a JSON Lines file, one compact JSON object per line.
+    
+    Unlike save_json, appending never re-serializes what is already in the
+    file, so N appends cost N records rather than the whole array each time.
+    
+    Args:
+        records: Records to append
+        filepath: Path of the .jsonl file (created if missing)
+    """
+    dir_path = os.path.dirname(filepath)
+    if dir_path:
+        ensure_directory(dir_path)
+    if orjson is not None:
+        lines = [orjson.dumps(record, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY) + b"\n"
+                 for record in records]
+    else:
+        lines = [json.dumps(record, ensure_ascii=False).encode('utf-8') + b"\n" for record in records]
+    with _open_in_directory(filepath, 'ab', dir_path) as f:
+        f.writelines(lines)
+
+
+# Directories already created by ensure_directory in this process
+_SEEN_DIRECTORIES: Set[str] = set()
+_SEEN_DIRECTORIES_LOCK = threading.Lock()
 
 
 def ensure_directory(path: str) -> None:
     """
     Create directory if it doesn't exist.
     
+    Directories are remembered per process, so repeated calls for the same
+    path skip the mkdir syscall. Call clear_directory_cache() after deleting
+    a directory tree that may be reused.
+    
     Args:
         path: Directory path to create
     """
-    if path:
-        Path(path).mkdir(parents=True, exist_ok=True)
+    if path and path not in _SEEN_DIRECTORIES:
+        os.makedirs(path, exist_ok=True)
+        with _SEEN_DIRECTORIES_LOCK:
+            _SEEN_DIRECTORIES.add(path)
+
+
+def clear_directory_cache() -> None:
+    """
+    Forget directories created through ensure_directory (e.g. after rmtree).
+    """
+    with _SEEN_DIRECTORIES_LOCK:
+        _SEEN_DIRECTORIES.clear()
+
+
+def _open_in_directory(filepath: str, mode: str, dir_path: str, **kwargs):
+    """
+    open() for writing into a directory passed to ensure_directory.
+    
+    If the directory was deleted without clear_directory_cache() being called,
+    it is recreated and the open retried, instead of failing on a stale cache.
+    """
+    try:
+        return open(filepath, mode, **kwargs)
+    except FileNotFoundError:
+        if not dir_path:
+            raise
+        with _SEEN_DIRECTORIES_LOCK:
+            _SEEN_DIRECTORIES.discard(dir_path)
+        ensure_directory(dir_path)
+        return open(filepath, mode, **kwargs)
+
+
+# (date ordinal, YYYY-MM-DD string) for get_reference_date; replaced as a
+# whole so concurrent callers never see one half updated without the other
+_reference_date_cache = (0, "")
 
 
 def get_reference_date() -> str:
@@ -62,23 +206,47 @@ def get_reference_date() -> str:
     Returns:
         Current date in YYYY-MM-DD format
     """
-    return datetime.now().strftime("%Y-%m-%d")
+    # The string only changes at midnight, so rebuild it only when the day changes
+    global _reference_date_cache
+    today = date.today()
+    ordinal = today.toordinal()
+    cached_ordinal, cached_iso = _reference_date_cache
+    if ordinal != cached_ordinal:
+        cached_iso = today.isoformat()
+        _reference_date_cache = (ordinal, cached_iso)
+    return cached_iso
+
+
+def _read_txt(filepath: str) -> str:
+    if os.path.getsize(filepath) > MMAP_THRESHOLD_BYTES:
+        # Decode straight from the mapped pages instead of reading into an
+        # intermediate bytes object first
+        with open(filepath, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            try:
+                return str(mm, "utf-8-sig")
+            except UnicodeDecodeError:
+                return str(mm, "latin-1")
+    # Read the bytes once and retry the decode in memory, rather than
+    # re-reading the file from disk for the latin-1 fallback
+    with open(filepath, "rb", buffering=0) as f:
+        raw = f.read()
+    try:
+        return raw.decode("utf-8-sig")
+    except UnicodeDecodeError:
+        return raw.decode("latin-1")
+
+
+# Input file extension -> reader
+_TEXT_FILE_READERS = {
+    ".txt": _read_txt,
+    ".pdf": extract_pdf_text,
+}
 
 
 def read_text_file(filepath: str) -> str:
     ext = os.path.splitext(filepath)[1].lower()
 
-    if ext == ".txt":
-        try:
-            with open(filepath, "r", encoding="utf-8-sig") as f:
-                return f.read()
-        except UnicodeDecodeError:
-            with open(filepath, "r", encoding="latin-1") as f:
-                return f.read()
-
-    elif ext == ".pdf":
-        return extract_pdf_text(filepath)
-
-    else:
+    reader = _TEXT_FILE_READERS.get(ext)
+    if reader is None:
         raise ValueError(f"Unsupported input file type: {ext}")
-
+    return reader(filepath)
@@ -3,41 +3,78 @@ from __future__ import annotations
 import os
 import sys
 import subprocess
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Tuple
 
+PROJECT_ROOT = Path(__file__).parent.resolve()
+MODELS_DIR = PROJECT_ROOT / "models"
+
+# Shared blob store for huggingface_hub; must be set before it is imported
+os.environ.setdefault("HF_HOME", str(MODELS_DIR / "hf_cache"))
+
+# Use the multi-connection Rust downloader when it is installed (optional)
+try:
+    import hf_transfer  # noqa: F401
+    os.environ.setdefault("HF_HUB_ENABLE_HF_TRANSFER", "1")
+except ImportError:
+    pass
+
 try:
     from huggingface_hub import snapshot_download
 except ImportError as exc:
     print("huggingface_hub is required. Install with `pip install huggingface_hub`.")
     raise
 
-
-PROJECT_ROOT = Path(__file__).parent.resolve()
-MODELS_DIR = PROJECT_ROOT / "models"
 SENTENCE_TRANSFORMER_ID = "sentence-transformers/all-MiniLM-L6-v2"
 HUGGINGFACE_MODEL_ID = "dbmdz/bert-large-cased-finetuned-conll03-english"
 SPACY_MODEL = "en_core_web_sm"
 ALLENNLP_SRL_MODEL_URL = "https://storage.googleapis.com/allennlp-public-models/bert-base-srl-2020.11.19.tar.gz"
 
+BANNER = "=" * 60
+
+# Parallel file downloads per snapshot_download call
+SNAPSHOT_MAX_WORKERS = 8
+
+# Only fetch configs, tokenizer files and safetensors weights; skip the duplicate
+# PyTorch/TF/Flax/ONNX/OpenVINO exports these repos also ship
+SNAPSHOT_ALLOW_PATTERNS = ["*.json", "*.txt", "model.safetensors", "tokenizer*", "vocab*"]
+
+# Files whose presence means a snapshot is already on disk
+SNAPSHOT_SENTINELS = ("config.json", "model.safetensors")
+
+
 def ensure_dir(path: Path) -> None:
     path.mkdir(parents=True, exist_ok=True)
 
 
+def is_snapshot_present(target_root: Path) -> bool:
+    """Check for an existing local snapshot (set FORCE_REDOWNLOAD=1 to ignore it)."""
+    if os.environ.get("FORCE_REDOWNLOAD") == "1":
+        return False
+    return all((target_root / name).exists() for name in SNAPSHOT_SENTINELS)
+
+
 def download_sentence_transformer() -> Tuple[bool, str]:
     target_root = MODELS_DIR / "sentence_transformers"
     ensure_dir(target_root)
-    print("=" * 60)
-    print(f"Downloading Sentence Transformer model: {SENTENCE_TRANSFORMER_ID}")
-    print(f"Target directory: {target_root}")
-    print("=" * 60)
+    print(
+        f"{BANNER}\n"
+        f"Downloading Sentence Transformer model: {SENTENCE_TRANSFORMER_ID}\n"
+        f"Target directory: {target_root}\n"
+        f"{BANNER}"
+    )
+
+    if is_snapshot_present(target_root):
+        return True, f"[OK] Sentence Transformer already present in {target_root} (skipped download)"
 
     try:
         snapshot_download(
             repo_id=SENTENCE_TRANSFORMER_ID,
             local_dir=target_root,
-            local_dir_use_symlinks=False,
             resume_download=True,
+            max_workers=SNAPSHOT_MAX_WORKERS,
+            allow_patterns=SNAPSHOT_ALLOW_PATTERNS,
         )
         return True, f"[OK] Sentence Transformer stored in {target_root}"
     except Exception as exc:  # noqa: BLE001
@@ -47,17 +84,23 @@ def download_sentence_transformer() -> Tuple[bool, str]:
 def download_huggingface_model() -> Tuple[bool, str]:
     target_root = MODELS_DIR / "huggingface"
     ensure_dir(target_root)
-    print("=" * 60)
-    print(f"Downloading HuggingFace SRL model: {HUGGINGFACE_MODEL_ID}")
-    print(f"Target directory: {target_root}")
-    print("=" * 60)
+    print(
+        f"{BANNER}\n"
+        f"Downloading HuggingFace SRL model: {HUGGINGFACE_MODEL_ID}\n"
+        f"Target directory: {target_root}\n"
+        f"{BANNER}"
+    )
+
+    if is_snapshot_present(target_root):
+        return True, f"[OK] HuggingFace model already present in {target_root} (skipped download)"
 
     try:
         snapshot_download(
             repo_id=HUGGINGFACE_MODEL_ID,
             local_dir=target_root,
-            local_dir_use_symlinks=False,
             resume_download=True,
+            max_workers=SNAPSHOT_MAX_WORKERS,
+            allow_patterns=SNAPSHOT_ALLOW_PATTERNS,
         )
         return True, f"[OK] HuggingFace model stored in {target_root}"
     except Exception as exc:  # noqa: BLE001
@@ -66,9 +109,24 @@ def download_huggingface_model() -> Tuple[bool, str]:
 
 def download_spacy_model() -> Tuple[bool, str]:
     """Install spaCy model (stored in spaCy's standard location)."""
-    print("=" * 60)
-    print(f"Installing spaCy model: {SPACY_MODEL}")
-    print("=" * 60)
+    print(f"{BANNER}\nInstalling spaCy model: {SPACY_MODEL}\n{BANNER}")
+    try:
+        from spacy.cli.download import download as spacy_download
+    except ImportError:
+        spacy_download = None
+
+    if spacy_download is not None:
+        # Same as `python -m spacy download`, minus a second interpreter start + spaCy import
+        try:
+            spacy_download(SPACY_MODEL)
+            return True, "[OK] spaCy model installed (managed by spaCy)"
+        except SystemExit as exc:  # spaCy's CLI helpers exit on failure
+            if not exc.code:
+                return True, "[OK] spaCy model installed (managed by spaCy)"
+            return False, f"[FAIL] Failed to install spaCy model: exit code {exc.code}"
+        except Exception as exc:  # noqa: BLE001
+            return False, f"[FAIL] Failed to install spaCy model: {exc}"
+
     try:
         subprocess.run(
             [sys.executable, "-m", "spacy", "download", SPACY_MODEL],
@@ -82,13 +140,15 @@ def download_spacy_model() -> Tuple[bool, str]:
 
 def download_allennlp_srl_model() -> Tuple[bool, str]:
     """Download AllenNLP SRL model (will be cached by AllenNLP)."""
-    print("=" * 60)
-    print("Downloading AllenNLP SRL model")
-    print(f"Model URL: {ALLENNLP_SRL_MODEL_URL}")
-    print("=" * 60)
-    print("Note: AllenNLP has dependency conflicts with spaCy 3.x")
-    print("      This step is optional and will be skipped if AllenNLP is not available.")
-    print("=" * 60)
+    print(
+        f"{BANNER}\n"
+        "Downloading AllenNLP SRL model\n"
+        f"Model URL: {ALLENNLP_SRL_MODEL_URL}\n"
+        f"{BANNER}\n"
+        "Note: AllenNLP has dependency conflicts with spaCy 3.x\n"
+        "      This step is optional and will be skipped if AllenNLP is not available.\n"
+        f"{BANNER}"
+    )
     
     try:
         from allennlp.predictors.predictor import Predictor
@@ -115,34 +175,33 @@ def download_allennlp_srl_model() -> Tuple[bool, str]:
         return False, f"[WARN] Failed to download AllenNLP SRL model: {exc} (optional step)"
 
 def main() -> None:
-    print("\n" + "=" * 60)
-    print("Temporal Memory Layer - Model Download")
-    print("=" * 60)
-    print("Models will be stored under: models/\n")
+    print(
+        f"\n{BANNER}\n"
+        "Temporal Memory Layer - Model Download\n"
+        f"{BANNER}\n"
+        "Models will be stored under: models/\n"
+    )
 
     ensure_dir(MODELS_DIR)
 
-    successes = []
-
-    success, message = download_sentence_transformer()
-    print(message)
-    successes.append(success)
-
-    success, message = download_huggingface_model()
-    print(message)
-    successes.append(success)
-
-    success, message = download_spacy_model()
-    print(message)
-    successes.append(success)
-
-    success, message = download_allennlp_srl_model()
-    print(message)
-    successes.append(success)
-
-    print("\n" + "=" * 60)
-    print("Summary")
-    print("=" * 60)
+    # Downloads are network-bound and target separate directories, so run them together
+    downloaders = [
+        ("sentence_transformer", download_sentence_transformer),
+        ("huggingface", download_huggingface_model),
+        ("spacy", download_spacy_model),
+        ("allennlp_srl", download_allennlp_srl_model),  # Optional, keep last
+    ]
+    results = {}
+    with ThreadPoolExecutor(max_workers=len(downloaders)) as executor:
+        futures = {executor.submit(download): name for name, download in downloaders}
+        for future in as_completed(futures):
+            success, message = future.result()
+            print(message)
+            results[futures[future]] = success
+
+    successes = [results[name] for name, _ in downloaders]
+
+    print(f"\n{BANNER}\nSummary\n{BANNER}")
     # Count non-optional failures (AllenNLP is optional)
     required_successes = successes[:-1]  # All except last (AllenNLP)
     if all(required_successes):
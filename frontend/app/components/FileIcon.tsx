@@ -1,24 +1,32 @@
 import React from 'react';
 
+// Built once at module load instead of re-assembling the class string for
+// every icon on every render.
+const ICON_FRAME_BASE = 'w-[100px] h-[120px] rounded-lg flex items-center justify-center transition-all';
+const ICON_FRAME_SELECTED = `${ICON_FRAME_BASE} bg-gradient-to-b from-[#E8DFFF] to-[#D5C8F5] border-[3px] border-[#9B7EDC]`;
+const ICON_FRAME_DEFAULT = `${ICON_FRAME_BASE} bg-gradient-to-b from-[#FAF8FE] to-[#F0EBFF] border-2 border-[#D7CFF1] hover:from-[#F1ECFF] hover:to-[#E5DCFF] hover:border-[#C4B3E8]`;
+
+function fileExtensionLabel(filename: string): string {
+  // Same result as split('.').pop() without allocating the parts array
+  return filename.slice(filename.lastIndexOf('.') + 1).toUpperCase() || 'TXT';
+}
+
 interface FileIconProps {
+  fileId: string;
   filename: string;
-  filepath: string;
   selected: boolean;
-  onClick: () => void;
+  onSelect: (fileId: string) => void;
 }
 
-export function FileIcon({ filename, filepath, selected, onClick }: FileIconProps) {
-  const ext = filename.split('.').pop()?.toUpperCase() || 'TXT';
+// Memoized so that deleting or selecting one file only re-renders the icons
+// whose props actually changed, not the whole grid.
+export const FileIcon = React.memo(function FileIcon({ fileId, filename, selected, onSelect }: FileIconProps) {
+  // Only recomputed when the filename changes, not on selection toggles
+  const ext = React.useMemo(() => fileExtensionLabel(filename), [filename]);
 
   return (
-    <div className="flex flex-col items-center gap-1.5 cursor-pointer" onClick={onClick}>
-      <div className={`
-        w-[100px] h-[120px] rounded-lg flex items-center justify-center transition-all 
-        ${selected 
-          ? 'bg-gradient-to-b from-[#E8DFFF] to-[#D5C8F5] border-[3px] border-[#9B7EDC]' 
-          : 'bg-gradient-to-b from-[#FAF8FE] to-[#F0EBFF] border-2 border-[#D7CFF1] hover:from-[#F1ECFF] hover:to-[#E5DCFF] hover:border-[#C4B3E8]'
-        }
-      `}>
+    <div className="flex flex-col items-center gap-1.5 cursor-pointer" onClick={() => onSelect(fileId)}>
+      <div className={selected ? ICON_FRAME_SELECTED : ICON_FRAME_DEFAULT}>
         <div className="flex flex-col items-center gap-2">
           <div className="text-5xl">📄</div>
           <div className="bg-[#9B7EDC] text-white text-[10px] font-bold px-2 py-0.5 rounded uppercase">
@@ -31,4 +39,4 @@ export function FileIcon({ filename, filepath, selected, onClick }: FileIconProp
       </div>
     </div>
   );
-}
+});
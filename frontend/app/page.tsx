@@ -36,6 +36,9 @@ export default function Home() {
 
   // Ref for EventSource to close it if component unmounts
   const eventSourceRef = useRef<EventSource | null>(null);
+  // Progress lines arriving between frames are appended in one state update
+  const pendingProgressRef = useRef<string[]>([]);
+  const progressFrameRef = useRef<number | null>(null);
   // const isInitialMount = useRef(true); // No longer needed if we always reset
 
   const selectedFile = uploadedFiles.find((f) => f.id === selectedFileId);
@@ -49,6 +52,29 @@ export default function Home() {
     setTimeout(() => setSystemFeedback(""), duration);
   }, []);
 
+  const flushProgress = useCallback(() => {
+    progressFrameRef.current = null;
+    const lines = pendingProgressRef.current;
+    if (lines.length === 0) return;
+    pendingProgressRef.current = [];
+    setProgressOutput((prev) => prev + lines.join(""));
+  }, []);
+
+  const appendProgress = useCallback((text: string) => {
+    pendingProgressRef.current.push(text);
+    if (progressFrameRef.current === null) {
+      progressFrameRef.current = requestAnimationFrame(flushProgress);
+    }
+  }, [flushProgress]);
+
+  const discardPendingProgress = useCallback(() => {
+    if (progressFrameRef.current !== null) {
+      cancelAnimationFrame(progressFrameRef.current);
+      progressFrameRef.current = null;
+    }
+    pendingProgressRef.current = [];
+  }, []);
+
   // Fetch files (still used after upload)
   const fetchFiles = useCallback(async () => {
     try {
@@ -75,20 +101,24 @@ export default function Home() {
         setUploadedFiles([]);
         setSelectedFileId(null);
         setInconsistenciesOutput("");
+        discardPendingProgress();
         setProgressOutput("");
       } catch (err) {
         console.error("Failed to reset session:", err);
       }
     };
     resetSession();
-  }, []); // Run once on mount
+  }, [discardPendingProgress]); // Run once on mount (the callback is stable)
 
   const uploadFiles = useCallback(async (files: FileList | File[]) => {
+      // The backend overwrites by filename, so only the last file per name in a
+      // batch needs uploading. Keyed lookup keeps this linear for large drops.
+      const batch = new Map<string, File>();
       for (const file of Array.from(files)) {
-        // Basic check to avoid duplicates/unnecessary calls if we know it's there? 
-        // Logic handled by backend overwrite usually, but frontend check is nice.
-        // Since we allow duplicates (overwrite), we just proceed.
-        
+        batch.set(file.name, file);
+      }
+
+      for (const file of batch.values()) {
         const formData = new FormData();
         formData.append("file", file);
 
@@ -150,10 +180,11 @@ export default function Home() {
       return;
     }
     setInconsistenciesOutput("");
+    discardPendingProgress();
     setProgressOutput("");
     setSelectedRule(null);
     setSelectedFileId(fileId);
-  }, [pipelineRunning, showSystemFeedback]);
+  }, [pipelineRunning, showSystemFeedback, discardPendingProgress]);
 
   // Fetch content when user wants to view text
   const handleLoadFile = useCallback(async () => {
@@ -194,6 +225,7 @@ export default function Home() {
         setUploadedFiles((prev) => prev.filter((f) => f.id !== selectedFileId));
         setSelectedFileId(null);
         setInconsistenciesOutput("");
+        discardPendingProgress();
         setProgressOutput("");
         setViewMode("file");
         showSystemFeedback("File removed.");
@@ -203,7 +235,7 @@ export default function Home() {
     } catch (err) {
       showSystemFeedback("Error deleting file.");
     }
-  }, [selectedFile, selectedFileId, showSystemFeedback, pipelineRunning]);
+  }, [selectedFile, selectedFileId, showSystemFeedback, pipelineRunning, discardPendingProgress]);
 
   const handleRuleSelect = useCallback(
     (rule: RuleType) => {
@@ -221,6 +253,7 @@ export default function Home() {
     if (!selectedFile || !selectedRule) return;
 
     setPipelineRunning(true);
+    discardPendingProgress();
     setProgressOutput(
       `Initializing analysis for ${selectedFile.filename}...\n`,
     );
@@ -245,12 +278,12 @@ export default function Home() {
 
     evtSource.onmessage = (event) => {
       // Append log to progress
-      setProgressOutput((prev) => prev + event.data + "\n");
+      appendProgress(event.data + "\n");
     };
 
     evtSource.addEventListener("result", (event: MessageEvent) => {
-      const data = JSON.parse(event.data);
-      setInconsistenciesOutput(data.feedback);
+      // Feedback HTML arrives as-is (no JSON envelope)
+      setInconsistenciesOutput(event.data);
       evtSource.close();
       setPipelineRunning(false);
     });
@@ -268,11 +301,11 @@ export default function Home() {
 
     // Custom error event from server
     evtSource.addEventListener("error_msg", (event: MessageEvent) => {
-      setProgressOutput((prev) => prev + "[ERROR] " + event.data + "\n");
+      appendProgress("[ERROR] " + event.data + "\n");
       evtSource.close();
       setPipelineRunning(false);
     });
-  }, [selectedFile, selectedRule]);
+  }, [selectedFile, selectedRule, appendProgress, discardPendingProgress]);
 
   // Cleanup on unmount
   useEffect(() => {
@@ -280,8 +313,9 @@ export default function Home() {
       if (eventSourceRef.current) {
         eventSourceRef.current.close();
       }
+      discardPendingProgress();
     };
-  }, []);
+  }, [discardPendingProgress]);
 
  return (
     <div className="min-h-screen bg-[#F6F3FA] p-4 sm:p-5 font-sans">
@@ -350,10 +384,10 @@ export default function Home() {
                         {uploadedFiles.map((file) => (
                             <FileIcon
                             key={file.id}
+                            fileId={file.id}
                             filename={file.filename}
-                            filepath={file.filepath}
                             selected={file.id === selectedFileId}
-                            onClick={() => handleFileSelect(file.id)}
+                            onSelect={handleFileSelect}
                             />
                         ))}
                         </div>
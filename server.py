@@ -1,24 +1,41 @@
 
+import asyncio
+import hashlib
+import io
 import sys
 import os
-import io
-import time
 import shutil
-import threading
-import contextlib
 import json
-import logging
-import queue
+import re
 import subprocess 
-from typing import Optional, Generator
+import traceback
+from functools import lru_cache
+from typing import Any, Optional, AsyncGenerator, Dict, List, Tuple
 from pathlib import Path
 
-from backend.model_cache import get_model_status
+try:
+    import ijson
+except ImportError:  # ijson is optional; the reuse check falls back to json.load
+    ijson = None
 
-from fastapi import FastAPI, UploadFile, File, Form, HTTPException, Query
+from backend.model_cache import get_model_status
+from backend.json_to_csv import run_json_to_csv
+from backend.events import generate_feedback as generate_temporal_feedback
+from backend.character import generate_feedback as generate_role_feedback
+from backend.feedback_format import format_feedback_html
+from backend.utils import clear_directory_cache
+
+# Run the pipeline on a worker thread instead of a fresh interpreter. Saves the
+# interpreter start and ML library imports per run, but a running analysis can
+# then no longer be terminated by /reset or a client disconnect.
+PIPELINE_IN_PROCESS = os.getenv("MEMOWEAVE_PIPELINE_IN_PROCESS", "0") == "1"
+if PIPELINE_IN_PROCESS:
+    from backend.pipeline import run_pipeline
+
+from fastapi import FastAPI, UploadFile, File, HTTPException, Query
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import StreamingResponse, JSONResponse
-from pydantic import BaseModel
 
 app = FastAPI(title="MemoWeave API")
 
@@ -31,6 +48,33 @@ allowed_origins = [
 # Filter out empty strings
 allowed_origins = [origin for origin in allowed_origins if origin]
 
+# Largest accepted upload request body
+MAX_UPLOAD_BYTES = 200 * 1024 * 1024
+
+class UploadSizeLimitMiddleware:
+    """
+    Reject oversized uploads from Content-Length, before the body is read.
+    Plain ASGI, so every other route (notably the SSE stream) passes straight
+    through without BaseHTTPMiddleware wrapping its response.
+    """
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and scope["method"] == "POST" and scope["path"] == "/upload":
+            content_length = dict(scope["headers"]).get(b"content-length", b"")
+            if content_length.isdigit() and int(content_length) > MAX_UPLOAD_BYTES:
+                response = JSONResponse(
+                    status_code=413,
+                    content={"detail": f"File too large (limit {MAX_UPLOAD_BYTES // (1024 * 1024)} MiB)"}
+                )
+                await response(scope, receive, send)
+                return
+        await self.app(scope, receive, send)
+
+# Added before CORS so CORS wraps it and the 413 still gets CORS headers
+app.add_middleware(UploadSizeLimitMiddleware)
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=allowed_origins,
@@ -44,14 +88,197 @@ UPLOAD_DIR = Path("data")
 OUTPUT_DIR = Path("output")
 MEMORY_DIR = OUTPUT_DIR / "memory"
 MEMORY_PATH = MEMORY_DIR / "memory_module.json"
+# Outside OUTPUT_DIR, which the pipeline wipes on every rebuild
+FEEDBACK_CACHE_DIR = Path("cache") / "feedback"
+# Cached feedback files kept on disk; the oldest are pruned beyond this
+FEEDBACK_CACHE_MAX_FILES = 64
+# Which upload the current memory module was built from
+MEMORY_SOURCE_PATH = MEMORY_DIR / "memory_source.json"
+
+# Rule -> CSV projection consumed by that rule's feedback generator
+RULE_CSV_PATHS = {
+    "temporal": MEMORY_DIR / "temporal_consistency.csv",
+    "role_completeness": MEMORY_DIR / "role_completeness.csv"
+}
+FEEDBACK_GENERATORS = {
+    "temporal": generate_temporal_feedback,
+    "role_completeness": generate_role_feedback
+}
 
 # Ensure directories exist
 UPLOAD_DIR.mkdir(exist_ok=True)
 OUTPUT_DIR.mkdir(exist_ok=True)
 
 # Global variables
-pipeline_lock = threading.Lock()
-current_analysis_process: Optional[subprocess.Popen] = None
+# One analysis at a time: every run shares OUTPUT_DIR and current_analysis_process.
+# An asyncio lock is checked and taken without blocking the event loop.
+pipeline_lock = asyncio.Lock()
+current_analysis_process: Optional[asyncio.subprocess.Process] = None
+
+# Seconds of silence on an SSE stream before a keep-alive comment is sent
+HEARTBEAT_INTERVAL = float(os.getenv("MEMOWEAVE_SSE_HEARTBEAT", "15"))
+# Buffer size for copying uploads when the zero-copy path is unavailable
+UPLOAD_COPY_BUFFER_SIZE = 1024 * 1024
+# Chunk size for streaming uploaded files back to the client
+FILE_STREAM_CHUNK_SIZE = 64 * 1024
+# Keep caches and reverse proxies (nginx X-Accel-Buffering) from holding back SSE frames
+SSE_HEADERS = {
+    "Cache-Control": "no-cache",
+    "X-Accel-Buffering": "no"
+}
+# MEMOWEAVE_LOG=DEBUG also streams DEBUG-level library log lines to the client
+SSE_DEBUG_LOGS = os.getenv("MEMOWEAVE_LOG", "INFO").upper() == "DEBUG"
+# Pipeline lines arriving within this many seconds are sent as one SSE event,
+# up to SSE_COALESCE_MAX_LINES lines per event
+SSE_COALESCE_WINDOW = 0.01
+SSE_COALESCE_MAX_LINES = 32
+# Max bytes buffered for one pipeline output line (progress bars redraw without newlines)
+PIPELINE_LINE_LIMIT = 1024 * 1024
+
+# Line terminators recognised inside an SSE stream
+_SSE_LINE_BREAK_RE = re.compile(r"\r\n|\r|\n")
+
+# The memory module is written with "events" first and "metadata" last, so
+# the reuse check can usually be answered from the head and tail of the file.
+_PROBE_BYTES = 4096
+_EVENTS_HEAD_RE = re.compile(rb'^\s*\{\s*"events"\s*:\s*\[\s*(\S)')
+_TOTAL_EVENTS_RE = re.compile(rb'"total_events"\s*:\s*(\d+)')
+
+def count_memory_events(memory_path: Path, size: int) -> int:
+    """
+    Number of events in a memory module, without parsing the whole file
+    when the head/tail probe is conclusive.
+    """
+    with open(memory_path, "rb") as f:
+        head = f.read(_PROBE_BYTES)
+        match = _EVENTS_HEAD_RE.match(head)
+        if match and match.group(1) == b"]":
+            return 0
+        if match:
+            f.seek(max(size - _PROBE_BYTES, 0))
+            total = _TOTAL_EVENTS_RE.findall(f.read())
+            if total:
+                return int(total[-1])
+        # Unexpected layout: count by streaming the events array when ijson is
+        # available (one event in memory at a time), else parse the whole file
+        f.seek(0)
+        if ijson is not None:
+            return sum(1 for _ in ijson.items(f, "events.item"))
+        events = json.load(f).get("events", [])
+    return len(events) if isinstance(events, list) else 0
+
+# (upload dir mtime_ns, /files response) of the last directory scan
+_files_cache: Tuple[int, List[Dict[str, str]]] = (-1, [])
+
+def feedback_cache_key(memory_path: Path, story_path: Path, rule: str) -> str:
+    """Content hash of the inputs that determine a rule's feedback."""
+    digest = hashlib.blake2b(digest_size=16)
+    for path in (memory_path, story_path):
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                digest.update(chunk)
+        digest.update(b"\0")
+    return f"{digest.hexdigest()}_{rule}"
+
+@lru_cache(maxsize=64)
+def load_cached_feedback(cache_key: str) -> str:
+    """
+    Read cached feedback HTML. Raises FileNotFoundError on a miss, which
+    lru_cache does not memoize; hits are content-addressed so never go stale.
+    """
+    with open(FEEDBACK_CACHE_DIR / f"{cache_key}.html", "r", encoding="utf-8") as f:
+        return f.read()
+
+def store_cached_feedback(cache_key: str, html_text: str) -> None:
+    FEEDBACK_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    cache_path = FEEDBACK_CACHE_DIR / f"{cache_key}.html"
+    tmp_path = cache_path.with_suffix(".html.tmp")
+    # Write then swap, so a concurrent reader never sees a partial file
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(html_text)
+    os.replace(tmp_path, cache_path)
+    _prune_feedback_cache()
+
+def _prune_feedback_cache() -> None:
+    """Drop the least recently written cache files beyond FEEDBACK_CACHE_MAX_FILES."""
+    entries = []
+    for entry in os.scandir(FEEDBACK_CACHE_DIR):
+        if entry.name.endswith(".html"):
+            try:
+                entries.append((entry.stat().st_mtime_ns, entry.path))
+            except FileNotFoundError:
+                pass
+    if len(entries) <= FEEDBACK_CACHE_MAX_FILES:
+        return
+    entries.sort()
+    for _, path in entries[:-FEEDBACK_CACHE_MAX_FILES]:
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            pass
+
+def _input_fingerprint(input_file: Path) -> Dict[str, Any]:
+    file_stat = os.stat(input_file)
+    return {"filename": input_file.name, "size": file_stat.st_size, "mtime_ns": file_stat.st_mtime_ns}
+
+def memory_matches_input(input_file: Path) -> bool:
+    """True if the memory module on disk was built from this exact upload."""
+    try:
+        with open(MEMORY_SOURCE_PATH, "r", encoding="utf-8") as f:
+            return json.load(f) == _input_fingerprint(input_file)
+    except (FileNotFoundError, ValueError):
+        return False
+
+def record_memory_source(input_file: Path) -> None:
+    MEMORY_DIR.mkdir(parents=True, exist_ok=True)
+    with open(MEMORY_SOURCE_PATH, "w", encoding="utf-8") as f:
+        json.dump(_input_fingerprint(input_file), f)
+
+def _stat_or_none(path: Path) -> Optional[os.stat_result]:
+    """Single stat() call standing in for exists() + getmtime()/getsize()."""
+    try:
+        return os.stat(path)
+    except FileNotFoundError:
+        return None
+
+def _release_pipeline_lock(task: asyncio.Future) -> None:
+    """Done-callback for an abandoned in-process pipeline run."""
+    if not task.cancelled() and task.exception() is not None:
+        print(f"Background pipeline run failed: {task.exception()}")
+    pipeline_lock.release()
+
+async def _terminate_process(process: asyncio.subprocess.Process, timeout: float = 2) -> None:
+    """Terminate a pipeline subprocess, killing it if it does not exit in time."""
+    try:
+        process.terminate()
+        try:
+            await asyncio.wait_for(process.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            process.kill()
+    except ProcessLookupError:
+        # Already exited
+        pass
+
+def _clear_directory(directory: Path) -> None:
+    """
+    Remove everything inside a directory, keeping the directory itself.
+    scandir() yields the entry type with the listing, so plain files are
+    unlinked without a stat() each and only subdirectories go to rmtree.
+    """
+    # An in-process pipeline must not trust directories it saw before this
+    clear_directory_cache()
+    try:
+        entries = list(os.scandir(directory))
+    except FileNotFoundError:
+        return
+    for entry in entries:
+        try:
+            if entry.is_dir(follow_symlinks=False):
+                shutil.rmtree(entry.path)
+            else:
+                os.unlink(entry.path)
+        except Exception as e:
+            print(f"Failed to clear {entry.path}: {e}")
 
 @app.get("/")
 def root():
@@ -68,6 +295,7 @@ def root():
             "upload": "POST /upload - Upload a text file for analysis",
             "files": "GET /files - List uploaded files",
             "file_content": "GET /files/{filename}/content - Get file content",
+            "file_stream": "GET /files/{filename}/stream - Stream raw file content",
             "delete_file": "DELETE /files/{filename} - Delete a file",
             "analyze": "GET /analyze_stream - Run analysis pipeline (streaming)",
             "reset": "POST /reset - Reset session and clear files"
@@ -80,24 +308,96 @@ def root():
 def health_check():
     return {"status": "ok"}
 
+def _sendfile_copy(source, buffer) -> bool:
+    """
+    Zero-copy upload copy for spooled uploads that already live on disk.
+    Returns False (with the source positioned where copying stopped) when
+    the fast path is unavailable.
+    """
+    # sendfile() to a regular file is Linux-only
+    if not sys.platform.startswith("linux"):
+        return False
+    # Anything that fits in one copy buffer gains nothing from sendfile, and
+    # small uploads are the ones still spooled in memory, where fileno()
+    # would first write them out to a temp file
+    try:
+        offset = source.tell()
+        size = source.seek(0, os.SEEK_END)
+        source.seek(offset)
+    except (AttributeError, OSError, io.UnsupportedOperation):
+        return False
+    if size - offset <= UPLOAD_COPY_BUFFER_SIZE:
+        return False
+    try:
+        src_fd = source.fileno()
+    except (AttributeError, OSError, io.UnsupportedOperation):
+        return False
+    dst_fd = buffer.fileno()
+    try:
+        while offset < size:
+            sent = os.sendfile(dst_fd, src_fd, offset, size - offset)
+            if sent == 0:
+                break
+            offset += sent
+    except OSError:
+        source.seek(offset)
+        return False
+    source.seek(offset)
+    return offset >= size
+
+def _readinto_copy(source, buffer) -> None:
+    """Copy through one reusable 1 MiB buffer instead of 16 KiB reads."""
+    readinto = getattr(source, "readinto", None)
+    if readinto is None:
+        shutil.copyfileobj(source, buffer, UPLOAD_COPY_BUFFER_SIZE)
+        return
+    view = memoryview(bytearray(UPLOAD_COPY_BUFFER_SIZE))
+    while True:
+        n = readinto(view)
+        if not n:
+            break
+        buffer.write(view[:n])
+
+def _save_upload(source, file_path: Path) -> None:
+    with open(file_path, "wb") as buffer:
+        if not _sendfile_copy(source, buffer):
+            _readinto_copy(source, buffer)
+
 @app.post("/upload")
 async def upload_file(file: UploadFile = File(...)):
     # print("UPLOAD HIT") # Reduced verbosity
     # print("Filename:", file.filename)
+    # Chunked requests carry no Content-Length; check the spooled size
+    # (UploadFile.size, newer Starlette) before anything reaches UPLOAD_DIR
+    upload_size = getattr(file, "size", None)
+    if upload_size is not None and upload_size > MAX_UPLOAD_BYTES:
+        raise HTTPException(status_code=413, detail=f"File too large (limit {MAX_UPLOAD_BYTES // (1024 * 1024)} MiB)")
     try:
         file_path = UPLOAD_DIR / file.filename
-        with open(file_path, "wb") as buffer:
-            shutil.copyfileobj(file.file, buffer)
+        # The copy is blocking disk I/O; keep it off the event loop so
+        # concurrent uploads and SSE streams are not stalled.
+        await run_in_threadpool(_save_upload, file.file, file_path)
         return {"filename": file.filename, "filepath": str(file_path)}
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"File upload failed: {str(e)}")
 
 @app.get("/files")
 def list_files():
-    files = []
-    if UPLOAD_DIR.exists():
-        for f in UPLOAD_DIR.glob("*.txt"):
-            files.append({"filename": f.name, "filepath": str(f)})
+    global _files_cache
+    upload_stat = _stat_or_none(UPLOAD_DIR)
+    if upload_stat is None:
+        return []
+    # Adding, removing or renaming an entry bumps the directory mtime, so an
+    # unchanged mtime means the listing below would be identical
+    if upload_stat.st_mtime_ns == _files_cache[0]:
+        return _files_cache[1]
+    with os.scandir(UPLOAD_DIR) as entries:
+        files = [
+            {"filename": entry.name, "filepath": str(UPLOAD_DIR / entry.name)}
+            for entry in entries
+            if entry.name.endswith(".txt")
+        ]
+    _files_cache = (upload_stat.st_mtime_ns, files)
     return files
 
 @app.delete("/files/{filename}")
@@ -113,7 +413,7 @@ def delete_file(filename: str):
     raise HTTPException(status_code=404, detail="File not found")
 
 @app.post("/reset")
-def reset_session():
+async def reset_session():
     """
     Terminates ongoing analysis and clears uploaded files.
     Called on frontend mount (page reload).
@@ -121,50 +421,64 @@ def reset_session():
     global current_analysis_process
     
     # 1. Terminate running process
-    if current_analysis_process:
-        poll = current_analysis_process.poll()
-        if poll is None:
-            print("Terminating ongoing analysis process...")
-            current_analysis_process.terminate()
-            try:
-                current_analysis_process.wait(timeout=2)
-            except subprocess.TimeoutExpired:
-                current_analysis_process.kill()
+    process = current_analysis_process
+    if process and process.returncode is None:
+        print("Terminating ongoing analysis process...")
+        await _terminate_process(process)
     
     # 2. Clear Uploads
-    if UPLOAD_DIR.exists():
-        for f in UPLOAD_DIR.iterdir():
-            try:
-                if f.is_file():
-                    f.unlink()
-                elif f.is_dir():
-                    shutil.rmtree(f)
-            except Exception as e:
-                print(f"Failed to clear {f}: {e}")
+    await run_in_threadpool(_clear_directory, UPLOAD_DIR)
                 
     # 3. Clear Output (Optional, but good for clean slate)
-    if OUTPUT_DIR.exists():
-        try:
-             shutil.rmtree(OUTPUT_DIR)
-        except Exception as e:
-             print(f"Failed to clear output: {e}")
+    await run_in_threadpool(_clear_directory, OUTPUT_DIR)
 
     return {"status": "session_reset"}
 
 @app.get("/files/{filename}/content")
 def get_file_content(filename: str):
     file_path = UPLOAD_DIR / filename
-    if file_path.exists():
-        try:
-             with open(file_path, "r", encoding="utf-8") as f:
-                 return {"content": f.read()}
-        except UnicodeDecodeError:
-             with open(file_path, "r", encoding="latin-1") as f:
-                 return {"content": f.read()}
-    raise HTTPException(status_code=404, detail="File not found")
+    try:
+        # Read the bytes once; a non-UTF-8 file is re-decoded in memory
+        # instead of being read from disk a second time.
+        with open(file_path, "rb") as f:
+            raw = f.read()
+    except FileNotFoundError:
+        raise HTTPException(status_code=404, detail="File not found")
+    try:
+        return {"content": raw.decode("utf-8")}
+    except UnicodeDecodeError:
+        return {"content": raw.decode("latin-1")}
+
+def _iter_file_chunks(file_path: Path, chunk_size: int = FILE_STREAM_CHUNK_SIZE):
+    with open(file_path, "rb") as f:
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                break
+            yield chunk
+
+@app.get("/files/{filename}/stream")
+def stream_file_content(filename: str):
+    """
+    Raw file content in fixed-size chunks, without the JSON envelope of
+    /content, so large stories are sent in constant memory.
+    """
+    file_path = UPLOAD_DIR / filename
+    file_stat = _stat_or_none(file_path)
+    if file_stat is None:
+        raise HTTPException(status_code=404, detail="File not found")
+    return StreamingResponse(
+        _iter_file_chunks(file_path),
+        media_type="text/plain",
+        headers={"Content-Length": str(file_stat.st_size)}
+    )
 
 @app.get("/analyze_stream")
-async def analyze_stream(filename: str = Query(...), rule: str = Query(...), force_rebuild: bool = Query(False)):
+async def analyze_stream(
+    filename: str = Query(...),
+    rule: str = Query(...),
+    force_rebuild: bool = Query(False)
+):
     """
     Run the analysis pipeline as a subprocess and stream logs back to the client.
     """
@@ -172,7 +486,7 @@ async def analyze_stream(filename: str = Query(...), rule: str = Query(...), for
     if not input_file.exists():
         raise HTTPException(status_code=404, detail="Input file not found")
 
-    def analysis_generator() -> Generator[str, None, None]:
+    async def analysis_generator() -> AsyncGenerator[str, None]:
         global current_analysis_process
         
         # Helper to format and yield log messages
@@ -181,6 +495,16 @@ async def analyze_stream(filename: str = Query(...), rule: str = Query(...), for
             if not msg:
                 return None
             return f"data: {msg}\n\n"
+
+        def send_result(html_text: str) -> str:
+            # Raw HTML, one data: field per line (any line break would end a
+            # field), instead of a JSON envelope the client has to re-parse
+            data = "".join(f"data: {line}\n" for line in _SSE_LINE_BREAK_RE.split(html_text))
+            return f"event: result\n{data}\n"
+
+        def send_lines(lines: List[str]) -> str:
+            # Consecutive data: fields form one SSE event; EventSource joins them with "\n"
+            return "data: " + "\ndata: ".join(lines) + "\n\n"
             
         # Helper to filter progress bars
         def is_useful_log(line: str) -> bool:
@@ -189,20 +513,22 @@ async def analyze_stream(filename: str = Query(...), rule: str = Query(...), for
             if "it/s]" in line: return False
             if "%|" in line and "|" in line: return False
             if line.startswith("\r"): return False # Carriage return only updates
+            # Python logging's default "LEVEL:logger:message" format, e.g. urllib3
+            if not SSE_DEBUG_LOGS and line.startswith("DEBUG:"): return False
             return True
                 
-        if not pipeline_lock.acquire(blocking=False):
+        if pipeline_lock.locked():
             yield send_log("Analysis already in progress. Please wait.\n\n")
             return
+        # Not locked, so acquire() returns without suspending
+        await pipeline_lock.acquire()
+        pipeline_task: Optional[asyncio.Future] = None
 
         try:
-            # Clean output directory before starting new analysis
-            if OUTPUT_DIR.exists():
-                log_msg = send_log("Cleaning previous analysis output...")
-                if log_msg:
-                    yield log_msg
-                shutil.rmtree(OUTPUT_DIR)
-            OUTPUT_DIR.mkdir(exist_ok=True)
+            # Keep the previous output when it was built from this same upload;
+            # otherwise the pipeline run below wipes and rebuilds it
+            memory_reusable = not force_rebuild and await run_in_threadpool(memory_matches_input, input_file)
+            MEMORY_DIR.mkdir(parents=True, exist_ok=True)
             
             # Send initial log
             log_msg = send_log(f"Starting analysis for {filename} with rule {rule}...")
@@ -211,13 +537,13 @@ async def analyze_stream(filename: str = Query(...), rule: str = Query(...), for
             
             # Re-use memory logic (check if we should skip pipeline)
             should_run_pipeline = True
-            if not force_rebuild and MEMORY_PATH.exists():
+            memory_stat = _stat_or_none(MEMORY_PATH)
+            # An empty or "{}" file cannot hold any events; skip parsing it
+            if memory_reusable and memory_stat is not None and memory_stat.st_size > 2:
                 try:
-                    with open(MEMORY_PATH, "r", encoding="utf-8") as f:
-                        data = json.load(f)
-                    events = data.get("events", [])
-                    if isinstance(events, list) and len(events) > 0:
-                        msg = send_log(f"Found existing memory module with {len(events)} events.")
+                    event_count = await run_in_threadpool(count_memory_events, MEMORY_PATH, memory_stat.st_size)
+                    if event_count > 0:
+                        msg = send_log(f"Found existing memory module with {event_count} events.")
                         if msg:
                             yield msg
                         msg = send_log("Skipping pipeline execution and reusing memory.")
@@ -228,69 +554,119 @@ async def analyze_stream(filename: str = Query(...), rule: str = Query(...), for
                     pass
 
             if should_run_pipeline:
-                msg = send_log("Launching MemoWeave Pipeline subprocess...")
-                if msg:
-                    yield msg
-                
-                # Run pipeline.py as a separate process to ensure print() calls are captured properly
-                # and to avoid blocking the asyncio loop with heavy CPU tasks.
-                # -u flag forces unbuffered binary stdout/stderr
-                cmd = [sys.executable, "-u", "-m", "backend.pipeline", str(input_file), str(OUTPUT_DIR)]
-                
-                process = subprocess.Popen(
-                    cmd,
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.STDOUT,
-                    text=True,
-                    bufsize=1,  # Line buffered
-                    encoding='utf-8',
-                    cwd=os.getcwd(),
-                    env={**os.environ, 'PYTHONUNBUFFERED': '1'}  # Extra unbuffering
-                )
-                
-                current_analysis_process = process
+                if PIPELINE_IN_PROCESS:
+                    msg = send_log("Launching MemoWeave Pipeline...")
+                    if msg:
+                        yield msg
+
+                    # run_pipeline reports through log_callback from its worker
+                    # thread; a None sentinel marks the end of its output
+                    loop = asyncio.get_running_loop()
+                    output_queue: asyncio.Queue = asyncio.Queue()
+
+                    def pipeline_log(msg: str):
+                        loop.call_soon_threadsafe(output_queue.put_nowait, msg)
+
+                    pipeline_task = asyncio.ensure_future(run_in_threadpool(
+                        run_pipeline, str(input_file), str(OUTPUT_DIR), log_callback=pipeline_log
+                    ))
+                    pipeline_task.add_done_callback(lambda _: output_queue.put_nowait(None))
+                    next_output = output_queue.get
+                else:
+                    msg = send_log("Launching MemoWeave Pipeline subprocess...")
+                    if msg:
+                        yield msg
+                    
+                    # Run pipeline.py as a separate process to ensure print() calls are captured properly
+                    # and to avoid blocking the asyncio loop with heavy CPU tasks.
+                    # -u flag forces unbuffered binary stdout/stderr
+                    cmd = [sys.executable, "-u", "-m", "backend.pipeline", str(input_file), str(OUTPUT_DIR)]
+                    
+                    process = await asyncio.create_subprocess_exec(
+                        *cmd,
+                        stdout=asyncio.subprocess.PIPE,
+                        stderr=asyncio.subprocess.STDOUT,
+                        cwd=os.getcwd(),
+                        env={**os.environ, 'PYTHONUNBUFFERED': '1'},  # Extra unbuffering
+                        limit=PIPELINE_LINE_LIMIT
+                    )
+                    
+                    current_analysis_process = process
+
+                    # Set while the rest of an over-long line (progress bar redraws
+                    # without a newline) is being read and dropped. Kept outside
+                    # next_output so a keep-alive timeout cannot lose it.
+                    skipping_long_line = False
+
+                    async def next_output() -> Optional[str]:
+                        nonlocal skipping_long_line
+                        while True:
+                            try:
+                                raw = await process.stdout.readuntil(b"\n")
+                            except asyncio.IncompleteReadError as e:
+                                # EOF; whatever is left is the final unterminated line
+                                if skipping_long_line or not e.partial:
+                                    return None
+                                raw = e.partial
+                            except asyncio.LimitOverrunError as e:
+                                # The line is still buffered; drop it piecewise
+                                # until its newline turns up
+                                await process.stdout.readexactly(e.consumed)
+                                skipping_long_line = True
+                                continue
+                            if skipping_long_line:
+                                # Tail of the over-long line, up to its newline
+                                skipping_long_line = False
+                                continue
+                            return raw.decode("utf-8", errors="replace")
                 
-                # Stream output line by line using a queue to avoid blocking heartbeats
-                output_queue = queue.Queue()
-
-                def enqueue_output(out, q):
-                    for line in iter(out.readline, ''):
-                        q.put(line)
-                    out.close()
-
-                out_thread = threading.Thread(target=enqueue_output, args=(process.stdout, output_queue))
-                out_thread.daemon = True
-                out_thread.start()
-
-                last_heartbeat = time.time()
-                while process.poll() is None or not output_queue.empty():
+                # Await output line by line; the timeout only drives keep-alives,
+                # so the event loop is free while the pipeline is quiet. Lines that
+                # arrive within SSE_COALESCE_WINDOW of each other share one frame.
+                pending: List[str] = []
+                while True:
+                    timeout = SSE_COALESCE_WINDOW if pending else HEARTBEAT_INTERVAL
                     try:
-                        # Non-blocking get with short timeout
-                        line = output_queue.get(timeout=1.0)
-                        if is_useful_log(line):
-                            msg = send_log(line)
-                            if msg:
-                                yield msg
-                        last_heartbeat = time.time() # Reset on actual data
-                    except queue.Empty:
-                        # Check if it's time for a heartbeat (every 30 seconds)
-                        if time.time() - last_heartbeat > 30:
+                        text = await asyncio.wait_for(next_output(), timeout=timeout)
+                    except asyncio.TimeoutError:
+                        if pending:
+                            yield send_lines(pending)
+                            pending = []
+                        else:
                             yield ": keep-alive\n\n"
-                            last_heartbeat = time.time()
-                
-                out_thread.join(timeout=1)
+                        continue
+                    if text is None:
+                        break
+                    # Split on \r as well (as text-mode pipes did) so progress bar
+                    # redraws arrive as separate lines and get filtered; callback
+                    # messages such as tracebacks can also span several lines
+                    for line in text.splitlines():
+                        line = line.strip()
+                        if line and is_useful_log(line):
+                            pending.append(line)
+                    if len(pending) >= SSE_COALESCE_MAX_LINES:
+                        yield send_lines(pending)
+                        pending = []
+                if pending:
+                    yield send_lines(pending)
                 
-                current_analysis_process = None
-
-                if process.returncode != 0:
-                    # Check if it was killed by reset
-                    if process.returncode == -15 or process.returncode == 1: # Terminated usually -15 (SIGTERM) or 1 depending on OS
-                         error_msg = "Analysis terminated by user or reset."
-                    else:
-                         error_msg = f"Pipeline subprocess failed with exit code {process.returncode}"
-                    yield send_log(error_msg)
-                    raise RuntimeError(error_msg)
+                if PIPELINE_IN_PROCESS:
+                    # Re-raises a pipeline failure into the error handler below
+                    await pipeline_task
+                else:
+                    await process.wait()
+                    current_analysis_process = None
+
+                    if process.returncode != 0:
+                        # Check if it was killed by reset
+                        if process.returncode == -15 or process.returncode == 1: # Terminated usually -15 (SIGTERM) or 1 depending on OS
+                             error_msg = "Analysis terminated by user or reset."
+                        else:
+                             error_msg = f"Pipeline subprocess failed with exit code {process.returncode}"
+                        yield send_log(error_msg)
+                        raise RuntimeError(error_msg)
                 
+                record_memory_source(input_file)
                 msg = send_log("Pipeline execution finished.")
                 if msg:
                     yield msg
@@ -300,75 +676,86 @@ async def analyze_stream(filename: str = Query(...), rule: str = Query(...), for
             if msg:
                 yield msg
                 
-            if not MEMORY_PATH.exists():
+            memory_stat = _stat_or_none(MEMORY_PATH)
+            if memory_stat is None:
                  yield send_log("Analysis failed - No memory module.")
                  return
 
+            csv_path = RULE_CSV_PATHS.get(rule)
             
-            # Helper to run JSON->CSV in thread
-            from backend.json_to_csv import run_json_to_csv
-            from backend.events import generate_feedback as generate_temporal_feedback
-            from backend.character import generate_feedback as generate_role_feedback
-            
-            csv_map = {
-                "temporal": OUTPUT_DIR / "memory/temporal_consistency.csv",
-                "role_completeness": OUTPUT_DIR / "memory/role_completeness.csv"
-            }
-            csv_path = csv_map.get(rule)
-            
-            # Run the rest in a thread to keep the generator yielding
-            result_queue = queue.Queue()
+            # Run the rest in a worker thread; it posts progress back onto the loop
+            loop = asyncio.get_running_loop()
+            result_queue: asyncio.Queue = asyncio.Queue()
+
+            def post_result(item):
+                loop.call_soon_threadsafe(result_queue.put_nowait, item)
             
             def run_post_processing():
                 try:
-                    # CSV Projection
-                    if not csv_path.exists() or should_run_pipeline:
+                    # Same memory module + story + rule -> same feedback; skip the LLM
+                    cache_key = feedback_cache_key(MEMORY_PATH, input_file, rule)
+                    html_text = None
+                    if force_rebuild:
+                        load_cached_feedback.cache_clear()
+                    else:
+                        try:
+                            html_text = load_cached_feedback(cache_key)
+                        except FileNotFoundError:
+                            pass
+                    if html_text is not None:
+                        post_result(("log", "Reusing cached feedback for unchanged memory module."))
+                        post_result(("result", html_text))
+                        return
+
+                    # CSV Projection (rebuilt when missing or older than the memory module)
+                    csv_stat = _stat_or_none(csv_path)
+                    if (should_run_pipeline or csv_stat is None
+                            or csv_stat.st_mtime < memory_stat.st_mtime):
                         def capture_csv_log(msg):
-                            result_queue.put(("log", msg))
+                            post_result(("log", msg))
                         run_json_to_csv(str(MEMORY_PATH), rule, capture_csv_log)
-                        result_queue.put(("log", "Memory projection complete."))
+                        post_result(("log", "Memory projection complete."))
                     else:
-                        result_queue.put(("log", "Reusing existing CSV projection."))
+                        post_result(("log", "Reusing existing CSV projection."))
 
                     # Feedback Generation
-                    result_queue.put(("log", "Generating Feedback (this may take a moment)..."))
+                    post_result(("log", "Generating Feedback (this may take a moment)..."))
                     
                     feedback_text = ""
-                    if rule == "temporal":
-                        feedback_text = generate_temporal_feedback(str(csv_path), story_path=str(input_file))
-                    elif rule == "role_completeness":
-                        feedback_text = generate_role_feedback(str(csv_path), story_path=str(input_file))
-                        
-                    result_queue.put(("result", feedback_text))
+                    generate_feedback = FEEDBACK_GENERATORS.get(rule)
+                    if generate_feedback is not None:
+                        feedback_text = generate_feedback(str(csv_path), story_path=str(input_file))
+                    
+                    html_text = format_feedback_html(feedback_text)
+                    # Generators report LLM failures as "[ERROR] ..." text; never cache those
+                    if html_text and not feedback_text.startswith("[ERROR]"):
+                        store_cached_feedback(cache_key, html_text)
+                    post_result(("result", html_text))
                     
                 except Exception as e:
-                    import traceback
                     traceback.print_exc()
-                    result_queue.put(("error", str(e)))
+                    post_result(("error", str(e)))
 
-            post_thread = threading.Thread(target=run_post_processing)
-            post_thread.start()
+            post_task = asyncio.ensure_future(run_in_threadpool(run_post_processing))
+            # Queued after everything the worker posted, so the loop below wakes
+            # only on messages and never has to poll the task
+            post_task.add_done_callback(lambda _: result_queue.put_nowait(("done", None)))
             
             while True:
                 try:
-                    msg_type, content = result_queue.get(timeout=0.5)
+                    msg_type, content = await asyncio.wait_for(result_queue.get(), timeout=HEARTBEAT_INTERVAL)
                     if msg_type == "log":
                         msg = send_log(content)
                         if msg:
                             yield msg
                     elif msg_type == "result":
-                        # Format feedback
-                        import re
-                        html_text = re.sub(r"\*\*(.*?)\*\*", r"<b>\1</b>", content)
-                        html_text = re.sub(r'"(.*?)"', r"<b>\1</b>", html_text)
-                        html_text = html_text.replace("\n", "<br>")
-                        yield f"event: result\ndata: {json.dumps({'feedback': html_text})}\n\n"
+                        yield send_result(content)
                         break
                     elif msg_type == "error":
                         raise RuntimeError(content)
-                except queue.Empty:
-                    if not post_thread.is_alive():
+                    elif msg_type == "done":
                         break
+                except asyncio.TimeoutError:
                     yield ": keep-alive\n\n"
 
             msg = send_log("Analysis Complete!")
@@ -380,20 +767,21 @@ async def analyze_stream(filename: str = Query(...), rule: str = Query(...), for
             yield f"event: error_msg\ndata: Server Error: {str(e)}\n\n"
         finally:
             # Ensure process is killed if client disconnects
-            if current_analysis_process and current_analysis_process.poll() is None:
+            process = current_analysis_process
+            if process and process.returncode is None:
                 print("Client disconnected or stream ended. Terminating process...")
-                try:
-                    current_analysis_process.terminate()
-                    current_analysis_process.wait(timeout=2)
-                except Exception:
-                    # If terminate fails or times out, force kill
-                    if current_analysis_process:
-                        current_analysis_process.kill()
+                await _terminate_process(process)
 
             current_analysis_process = None
-            pipeline_lock.release()
+            if pipeline_task is not None and not pipeline_task.done():
+                # A pipeline thread cannot be interrupted; hold the lock until it
+                # finishes so the next run does not share OUTPUT_DIR with it
+                print("Client disconnected or stream ended. Pipeline will finish in the background...")
+                pipeline_task.add_done_callback(_release_pipeline_lock)
+            else:
+                pipeline_lock.release()
 
-    return StreamingResponse(analysis_generator(), media_type="text/event-stream")
+    return StreamingResponse(analysis_generator(), media_type="text/event-stream", headers=SSE_HEADERS)
 
 def ensure_models():
     """
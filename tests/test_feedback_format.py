@@ -0,0 +1,16 @@
+from backend.feedback_format import format_feedback_html
+
+
+def test_bold_and_quotes_render_bold():
+    text = 'The **Temporal** issue is in "Now it was night".'
+    assert format_feedback_html(text) == (
+        'The <b>Temporal</b> issue is in <b>Now it was night</b>.'
+    )
+
+
+def test_newlines_become_line_breaks():
+    assert format_feedback_html("one\ntwo") == "one<br>two"
+
+
+def test_quote_overlapping_bold_span_renders_both():
+    assert format_feedback_html('"a **b" c**') == "<b>a <b>b</b> c</b>"
@@ -0,0 +1,21 @@
+import math
+
+from backend.utils import load_json, save_json
+
+
+def test_wide_integer_round_trips_exactly(tmp_path):
+    path = str(tmp_path / "big.json")
+    save_json({"big": 2**70, "small": 7}, path)
+    data = load_json(path)
+    assert data["big"] == 2**70
+    assert isinstance(data["big"], int)
+    assert data["small"] == 7
+
+
+def test_non_finite_floats_round_trip(tmp_path):
+    path = str(tmp_path / "nan.json")
+    save_json({"nan": float("nan"), "inf": float("inf"), "none": None}, path)
+    data = load_json(path)
+    assert math.isnan(data["nan"])
+    assert data["inf"] == float("inf")
+    assert data["none"] is None